@@ -0,0 +1,135 @@
+"""Plot refresh memory benchmark.
+
+Loads synthetic columns into the main window and counts how many
+full-size buffers each plot refresh allocates. The peak resident set
+size (VmHWM, reset through /proc/self/clear_refs) covers both NumPy and
+polars allocations. Exits with a non-zero status if a scenario exceeds
+its budget or the original array is reconverted. Linux only.
+
+Usage:
+    python benchmarks/refresh_memory.py
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 让分配器立即归还释放的内存，峰值RSS才能反映每次刷新的分配
+ALLOCATOR_ENV = {
+    "_RJEM_MALLOC_CONF": "dirty_decay_ms:0,muzzy_decay_ms:0",  # polars (jemalloc)
+    "MALLOC_MMAP_THRESHOLD_": "131072",  # NumPy (glibc)
+    "MALLOC_TRIM_THRESHOLD_": "131072",
+    "QT_QPA_PLATFORM": "offscreen",
+}
+if any(os.environ.get(key) != value for key, value in ALLOCATOR_ENV.items()):
+    # 分配器参数只在进程启动时读取
+    os.environ.update(ALLOCATOR_ENV)
+    os.execv(sys.executable, [sys.executable, *sys.argv])
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import polars as pl
+from PyQt6.QtWidgets import QApplication
+from gui.main_window import MainWindow
+from processors.limit_filter import LimitFilter
+from processors.moving_average import MovingAverage
+
+# 数据点数量
+ROWS = 4_000_000
+REFRESHES = 3
+
+# 测量误差容限（整列的比例）
+TOLERANCE = 0.15
+
+# 各场景每次刷新允许的整列大小内存分配次数
+SCENARIOS = {
+    # 零拷贝路径：直接复用缓存的原始数组
+    "无处理": ("value", None, 0),
+    "含空值，无处理": ("with_nulls", None, 0),
+    # 过滤结果本身需要一份拷贝，时间列被裁剪掉
+    "上下限过滤": ("value", "limit", 1),
+    # 滚动均值及两次填充空值；填充后没有空值，转为NumPy时零拷贝
+    "含空值，移动平均": ("with_nulls", "moving_average", 2),
+}
+
+
+def make_data() -> pl.DataFrame:
+    """Create a sorted frame with a clean column and one with nulls."""
+    start = datetime(2024, 1, 1)
+    values = np.random.default_rng(0).normal(size=ROWS)
+    with_nulls = pl.Series(values).scatter(np.arange(0, ROWS, 1000), None)
+    return pl.DataFrame({
+        "DateTime": pl.datetime_range(
+            start, start + timedelta(seconds=ROWS - 1), interval="1s", eager=True
+        ),
+        "value": values,
+        "with_nulls": with_nulls,
+    })
+
+
+def _status(key: str) -> int:
+    """Read a memory field of /proc/self/status in bytes."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(key):
+                return int(line.split()[1]) * 1024
+    raise KeyError(key)
+
+
+def measure(window: MainWindow) -> float:
+    """Return the most full-size allocations seen in one refresh."""
+    column_bytes = ROWS * 8
+    worst = 0.0
+    for _ in range(REFRESHES):
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")  # 重置峰值RSS
+        base = _status("VmRSS")
+        window._update_plot()
+        worst = max(worst, (_status("VmHWM") - base) / column_bytes)
+    return worst
+
+
+def configure(window: MainWindow, processor: str) -> None:
+    """Enable only the named processor."""
+    for item in window.processors:
+        if isinstance(item, LimitFilter):
+            item.use_filter = processor == "limit"
+            item.lower_limit, item.upper_limit = -1.0, 1.0
+        if isinstance(item, MovingAverage):
+            item.use_ma = processor == "moving_average"
+
+
+def main() -> int:
+    """Run the benchmark and report budget violations."""
+    app = QApplication(sys.argv)
+    window = MainWindow()
+
+    # 只统计数据路径，不计入绘图库自身的内存
+    calls = []
+    window.plot_canvas.update_plot = lambda *args: calls.append(args)
+    window._on_data_loaded(make_data())
+
+    failures = []
+    for name, (column, processor, budget) in SCENARIOS.items():
+        window.column_selector.setCurrentText(column)
+        configure(window, processor)
+        window._update_plot()
+        original = calls[-1][0]
+
+        calls.clear()
+        allocations = measure(window)
+        print(f"{name}: 每次刷新 {allocations:.2f} 次整列分配 (预算 {budget})")
+        if allocations > budget + TOLERANCE:
+            failures.append(f"{name} 的整列分配超出预算")
+        if any(call[0] is not original for call in calls):
+            failures.append(f"{name} 刷新时重新转换了原始列")
+        calls.clear()
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
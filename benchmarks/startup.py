@@ -0,0 +1,105 @@
+"""Startup time benchmark.
+
+Traces module imports of ``main`` with ``python -X importtime`` and times
+how long the main window takes to appear. Exits with a non-zero status if
+a budget is exceeded or a deferred module is imported at startup.
+
+Usage:
+    python benchmarks/startup.py
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 启动时间预算（秒）
+IMPORT_BUDGET = 0.5
+WINDOW_BUDGET = 1.5
+
+# 启动时不应导入的重量级模块
+DEFERRED_MODULES = ["polars", "matplotlib", "pyqtgraph", "numpy"]
+
+WINDOW_SCRIPT = """
+import time
+start = time.perf_counter()
+import sys
+from PyQt6.QtWidgets import QApplication
+from gui.main_window import MainWindow
+app = QApplication(sys.argv)
+window = MainWindow()
+window.show()
+app.processEvents()
+print(time.perf_counter() - start)
+"""
+
+
+def _run(args: List[str]) -> subprocess.CompletedProcess:
+    """Run a Python subprocess from the repository root."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def trace_imports() -> Dict[str, Tuple[int, int]]:
+    """
+    Trace the imports triggered by ``import main``.
+
+    Returns:
+        Mapping of top-level module name to (cumulative us, nesting depth)
+    """
+    result = _run(["-X", "importtime", "-c", "import main"])
+    modules: Dict[str, Tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (int(cumulative), depth)
+    return modules
+
+
+def measure_window() -> float:
+    """Return the seconds from interpreter start to the shown main window."""
+    result = _run(["-c", WINDOW_SCRIPT])
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    """Run the benchmark and report budget violations."""
+    modules = trace_imports()
+    top_level = {name: us for name, (us, depth) in modules.items() if depth == 0}
+    import_time = sum(top_level.values()) / 1e6
+
+    print("最耗时的导入:")
+    for name, us in sorted(top_level.items(), key=lambda item: -item[1])[:10]:
+        print(f"  {name:<40} {us / 1e3:8.1f} ms")
+
+    window_time = measure_window()
+    print(f"导入耗时: {import_time:.3f} s (预算 {IMPORT_BUDGET} s)")
+    print(f"窗口显示耗时: {window_time:.3f} s (预算 {WINDOW_BUDGET} s)")
+
+    failures = []
+    for module in DEFERRED_MODULES:
+        if module in modules:
+            failures.append(f"启动时导入了 {module}")
+    if import_time > IMPORT_BUDGET:
+        failures.append("导入耗时超出预算")
+    if window_time > WINDOW_BUDGET:
+        failures.append("窗口显示耗时超出预算")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
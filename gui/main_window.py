@@ -1,15 +1,22 @@
-from typing import Optional, List
+from __future__ import annotations
+from typing import Optional, List, Dict, TYPE_CHECKING
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QComboBox, QLabel, QFileDialog
+    QPushButton, QComboBox, QLabel, QFileDialog, QToolBox, QMessageBox
 )
-import polars as pl
+from PyQt6.QtCore import QTimer
 from .widgets.data_loader import DataLoader
-from .widgets.plot_canvas import PlotCanvas
+from .widgets.data_exporter import DataExporter, ExportThread
+from .widgets.plot_canvas import available_backends, create_plot_canvas
 from processors.base import DataProcessor
 from processors.limit_filter import LimitFilter
 from processors.moving_average import MovingAverage
 from processors.duplicate_filter import DuplicateFilter
+from processors.resample import Resample
+
+if TYPE_CHECKING:
+    import numpy as np
+    import polars as pl
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -22,6 +29,9 @@ class MainWindow(QMainWindow):
         # 初始化成员变量
         self.df: Optional[pl.DataFrame] = None
         self.processors: List[DataProcessor] = []
+        self.export_thread: Optional[ExportThread] = None
+        # 原始列的NumPy视图，数据不变时只转换一次
+        self.original_arrays: Dict[str, np.ndarray] = {}
         
         # 创建UI
         self._setup_ui()
@@ -34,8 +44,8 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central_widget)
         
         # 主布局
-        main_layout = QHBoxLayout()
-        central_widget.setLayout(main_layout)
+        self.main_layout = QHBoxLayout()
+        central_widget.setLayout(self.main_layout)
         
         # 左侧控制面板
         control_panel = QWidget()
@@ -56,43 +66,74 @@ class MainWindow(QMainWindow):
         column_layout.addWidget(self.column_selector)
         control_layout.addLayout(column_layout)
         
-        # 处理器配置区域
-        self.processor_layout = QVBoxLayout()
-        control_layout.addLayout(self.processor_layout)
+        # 绘图后端选择
+        backend_layout = QHBoxLayout()
+        backend_layout.addWidget(QLabel("绘图后端:"))
+        self.backend_selector = QComboBox()
+        self.backend_selector.addItems(available_backends())
+        backend_layout.addWidget(self.backend_selector)
+        control_layout.addLayout(backend_layout)
+        
+        # 处理器配置区域，面板在展开时才创建
+        self.processor_box = QToolBox()
+        control_layout.addWidget(self.processor_box)
+        
+        # 数据导出部分
+        self.data_exporter = DataExporter()
+        self.data_exporter.export_requested.connect(self._on_export_requested)
+        control_layout.addWidget(self.data_exporter)
         
         # 添加弹性空间
         control_layout.addStretch()
         
         # 绘图区域
-        self.plot_canvas = PlotCanvas()
+        self.plot_canvas = create_plot_canvas(self.backend_selector.currentText())
+        self.backend_selector.currentTextChanged.connect(self._on_backend_changed)
         
         # 添加到主布局
-        main_layout.addWidget(control_panel)
-        main_layout.addWidget(self.plot_canvas)
+        self.main_layout.addWidget(control_panel)
+        self.main_layout.addWidget(self.plot_canvas)
     
     def _setup_processors(self) -> None:
         """Initialize data processors."""
         # 添加处理器
         self.processors = [
+            Resample(),  # 放在最前，先缩减数据量
             LimitFilter(),
             MovingAverage(),
             DuplicateFilter()
         ]
         
-        # 添加处理器控件
+        # 添加处理器页面占位
         for processor in self.processors:
-            self.processor_layout.addWidget(processor.get_widget())
+            page = QWidget()
+            page.setLayout(QVBoxLayout())
+            self.processor_box.addItem(page, processor.name)
+        self.processor_box.currentChanged.connect(self._ensure_processor_widget)
+        
+        # 当前页面在窗口显示后再创建
+        QTimer.singleShot(0, lambda: self._ensure_processor_widget(
+            self.processor_box.currentIndex()
+        ))
+    
+    def _ensure_processor_widget(self, index: int) -> None:
+        """Create the configuration widget of a processor on first use."""
+        if index < 0:
+            return
+        
+        page = self.processor_box.widget(index)
+        if page.layout().count() == 0:
+            page.layout().addWidget(self.processors[index].get_widget())
     
     def _on_data_loaded(self, df: pl.DataFrame) -> None:
         """Handle data loading completion."""
         self.df = df
+        self.original_arrays.clear()
         
-        # 更新列选择器
+        # 更新列选择器，选中第一列时会触发图表更新
         self.column_selector.clear()
         self.column_selector.addItems(self.df.columns[1:])  # 跳过DateTime列
-        
-        # 更新图表
-        self._update_plot()
+        self.data_exporter.export_button.setEnabled(True)
     
     def _on_column_changed(self, index: int) -> None:
         """Handle column selection change."""
@@ -114,6 +155,51 @@ class MainWindow(QMainWindow):
         # 更新图表
         self._update_plot()
     
+    def _on_backend_changed(self, backend: str) -> None:
+        """Replace the plot canvas with one using the selected backend."""
+        if not backend:
+            return
+        
+        canvas = create_plot_canvas(backend)
+        self.main_layout.replaceWidget(self.plot_canvas, canvas)
+        self.plot_canvas.deleteLater()
+        self.plot_canvas = canvas
+        
+        # 更新图表
+        self._update_plot()
+    
+    def _on_export_requested(self, path: str, all_columns: bool) -> None:
+        """Export the processed data in a background thread."""
+        if self.df is None or not self.column_selector.currentText():
+            return
+        
+        from utils.data_io import build_processing_plan
+        
+        # 在主线程中构建查询计划，后台线程只负责流式写入
+        frame = build_processing_plan(
+            self.df,
+            self.processors,
+            self.column_selector.currentText(),
+            all_columns
+        )
+        
+        self.data_exporter.export_button.setEnabled(False)
+        self.export_thread = ExportThread(frame, path)
+        self.export_thread.succeeded.connect(self._on_export_succeeded)
+        self.export_thread.failed.connect(self._on_export_failed)
+        self.export_thread.finished.connect(
+            lambda: self.data_exporter.export_button.setEnabled(True)
+        )
+        self.export_thread.start()
+    
+    def _on_export_succeeded(self, path: str) -> None:
+        """Handle export completion."""
+        QMessageBox.information(self, "完成", f"数据已导出到：\n{path}")
+    
+    def _on_export_failed(self, message: str) -> None:
+        """Handle export failure."""
+        QMessageBox.critical(self, "错误", f"导出数据时出错：\n{message}")
+    
     def _update_plot(self) -> None:
         """Update the plot with processed data."""
         if self.df is None or not self.column_selector.currentText():
@@ -121,17 +207,46 @@ class MainWindow(QMainWindow):
         
         # 获取当前列数据
         column = self.column_selector.currentText()
-        data = self.df[column]
         
-        # 依次应用所有处理器
-        processed_data = data
-        for processor in self.processors:
-            processed_data = processor.process(processed_data)
+        import numpy as np
+        from utils.data_io import build_processing_plan, TIME_COLUMN
+        from utils.rle import RUN_START, RUN_END
+        
+        original_data = self._original_array(column)
+        
+        # 依次应用所有处理器，重采样需要DateTime列，因此按数据帧处理
+        frame = self.df.lazy().select(TIME_COLUMN, column)
+        plan = build_processing_plan(
+            frame, self.processors, column, all_columns=True, keep_runs=True
+        )
+        
+        run_edges = None
+        if plan is frame:
+            # 没有启用任何处理器，直接复用原始列的数组
+            processed_data = original_data
+        else:
+            # 绘图不需要时间列，裁剪后过滤时不再复制DateTime
+            names = [name for name in plan.collect_schema().names() if name != TIME_COLUMN]
+            processed = plan.select(names).collect()
+            # 无空值的单块数据转换为零拷贝视图
+            processed_data = processed[column].to_numpy()
+            
+            # 重复值过滤后按段边界绘制阶梯线，最后一段延续到数据末尾
+            if RUN_START in processed.columns and len(processed) > 0:
+                run_edges = np.append(
+                    processed[RUN_START].to_numpy(), processed[RUN_END][-1]
+                )
         
         # 更新图表
         self.plot_canvas.update_plot(
-            data.to_numpy(),
-            processed_data.to_numpy(),
-            column
+            original_data,
+            processed_data,
+            column,
+            run_edges
         )
-        
\ No newline at end of file
+    
+    def _original_array(self, column: str) -> np.ndarray:
+        """Return the cached NumPy array of an unprocessed column."""
+        if column not in self.original_arrays:
+            self.original_arrays[column] = self.df[column].to_numpy()
+        return self.original_arrays[column]
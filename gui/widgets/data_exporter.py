@@ -0,0 +1,73 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from PyQt6.QtWidgets import (
+    QWidget, QHBoxLayout, QPushButton, QCheckBox, QFileDialog
+)
+from PyQt6.QtCore import pyqtSignal, QThread
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+class ExportThread(QThread):
+    """Thread that streams a lazy frame to disk."""
+    
+    # 信号定义
+    succeeded = pyqtSignal(str)  # 发送导出文件路径
+    failed = pyqtSignal(str)  # 发送错误信息
+    
+    def __init__(self, frame: pl.LazyFrame, path: str):
+        super().__init__()
+        self.frame = frame
+        self.path = path
+    
+    def run(self) -> None:
+        """Write the frame in streaming mode."""
+        from utils.data_io import sink_frame
+        
+        try:
+            sink_frame(self.frame, self.path)
+            self.succeeded.emit(self.path)
+        except BaseException as e:
+            # polars 的 Rust panic（PanicException）不是 Exception 的子类
+            self.failed.emit(str(e))
+
+
+class DataExporter(QWidget):
+    """Widget for exporting processed data."""
+    
+    # 信号定义
+    export_requested = pyqtSignal(str, bool)  # 发送导出路径和是否导出全部列
+    
+    def __init__(self):
+        super().__init__()
+        self._setup_ui()
+    
+    def _setup_ui(self) -> None:
+        """Setup the user interface."""
+        layout = QHBoxLayout()
+        self.setLayout(layout)
+        
+        # 导出按钮
+        self.export_button = QPushButton("导出数据")
+        self.export_button.setEnabled(False)
+        self.export_button.clicked.connect(self._export_data)
+        layout.addWidget(self.export_button)
+        
+        # 导出范围
+        self.all_columns_cb = QCheckBox("导出全部列")
+        layout.addWidget(self.all_columns_cb)
+    
+    def _export_data(self) -> None:
+        """Handle export button click."""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "导出数据",
+            "",
+            "Parquet files (*.parquet);;CSV files (*.csv)"
+        )
+        
+        if not file_path:
+            return
+        
+        self.export_requested.emit(file_path, self.all_columns_cb.isChecked())
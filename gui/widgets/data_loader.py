@@ -1,9 +1,8 @@
-from typing import Optional
+from typing import Optional, List, Union
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QPushButton, QFileDialog, QProgressDialog
 )
 from PyQt6.QtCore import pyqtSignal
-import polars as pl
 
 class DataLoader(QWidget):
     """Widget for loading data files."""
@@ -24,19 +23,37 @@ class DataLoader(QWidget):
         self.load_button = QPushButton("加载数据")
         self.load_button.clicked.connect(self._load_data)
         layout.addWidget(self.load_button)
+        
+        # 加载目录按钮
+        self.load_dir_button = QPushButton("加载目录")
+        self.load_dir_button.clicked.connect(self._load_directory)
+        layout.addWidget(self.load_dir_button)
     
     def _load_data(self) -> None:
         """Handle data loading."""
-        file_path, _ = QFileDialog.getOpenFileName(
+        file_paths, _ = QFileDialog.getOpenFileNames(
             self,
             "选择数据文件",
             "",
             "CSV files (*.csv);;All files (*.*)"
         )
         
-        if not file_path:
+        if not file_paths:
             return
-            
+        
+        self._load_paths(file_paths)
+    
+    def _load_directory(self) -> None:
+        """Handle loading every CSV file in a directory."""
+        dir_path = QFileDialog.getExistingDirectory(self, "选择数据目录")
+        
+        if not dir_path:
+            return
+        
+        self._load_paths(dir_path)
+    
+    def _load_paths(self, source: Union[str, List[str]]) -> None:
+        """Load and merge the given files, directory or glob pattern."""
         # 显示进度对话框
         progress = QProgressDialog("正在加载数据...", None, 0, 0, self)
         progress.setWindowTitle("请稍候")
@@ -44,8 +61,11 @@ class DataLoader(QWidget):
         progress.show()
         
         try:
+            # polars 在首次加载数据时才导入
+            from utils.data_io import load_csv_files
+            
             # 加载数据
-            df = pl.read_csv(file_path)
+            df = load_csv_files(source)
             self.data_loaded.emit(df)
         except Exception as e:
             from PyQt6.QtWidgets import QMessageBox
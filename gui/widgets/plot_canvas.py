@@ -1,16 +1,16 @@
-from typing import Optional
-import numpy as np
+from __future__ import annotations
+from typing import Optional, List, TYPE_CHECKING
+import importlib.util
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import (
-    FigureCanvasQTAgg as FigureCanvas,
-    NavigationToolbar2QT as NavigationToolbar
-)
-import matplotlib.pyplot as plt
 
-# 设置字体
-plt.rcParams['font.sans-serif'] = ['SimHei']  # 用来正常显示中文标签
-plt.rcParams['axes.unicode_minus'] = False  # 用来正常显示负号
+if TYPE_CHECKING:
+    import numpy as np
+
+# 中文字体设置，首次创建图表时才应用
+_FONT_PARAMS = {
+    'font.sans-serif': ['SimHei'],  # 用来正常显示中文标签
+    'axes.unicode_minus': False,  # 用来正常显示负号
+}
 
 
 class PlotCanvas(QWidget):
@@ -18,21 +18,34 @@ class PlotCanvas(QWidget):
     
     def __init__(self):
         super().__init__()
+        self.figure = None
         self._setup_ui()
     
     def _setup_ui(self) -> None:
         """Setup the user interface."""
+        # 图表在首次绘图时才创建，避免启动时导入matplotlib
         layout = QVBoxLayout()
         self.setLayout(layout)
+    
+    def _create_figure(self) -> None:
+        """Import matplotlib and create the figure, canvas and toolbar."""
+        import matplotlib
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import (
+            FigureCanvasQTAgg as FigureCanvas,
+            NavigationToolbar2QT as NavigationToolbar
+        )
+        
+        matplotlib.rcParams.update(_FONT_PARAMS)
         
         # 创建图表
         self.figure = Figure()
         self.canvas = FigureCanvas(self.figure)
-        layout.addWidget(self.canvas)
+        self.layout().addWidget(self.canvas)
         
         # 添加工具栏
         self.toolbar = NavigationToolbar(self.canvas, self)
-        layout.addWidget(self.toolbar)
+        self.layout().addWidget(self.toolbar)
         
         # 创建子图
         self.ax1 = self.figure.add_subplot(211)
@@ -41,7 +54,8 @@ class PlotCanvas(QWidget):
     def update_plot(self, 
                    original_data: np.ndarray, 
                    processed_data: np.ndarray,
-                   title: str) -> None:
+                   title: str,
+                   run_edges: Optional[np.ndarray] = None) -> None:
         """
         Update the plot with new data.
         
@@ -49,7 +63,11 @@ class PlotCanvas(QWidget):
             original_data: Original data array
             processed_data: Processed data array
             title: Plot title
+            run_edges: Run boundaries, one more than processed values; draws steps
         """
+        if self.figure is None:
+            self._create_figure()
+        
         # 清除现有图表
         self.ax1.clear()
         self.ax2.clear()
@@ -61,7 +79,11 @@ class PlotCanvas(QWidget):
         self.ax1.legend()
         
         # 绘制处理后数据
-        self.ax2.plot(processed_data, 'r-', label='处理后数据')
+        if run_edges is None:
+            self.ax2.plot(processed_data, 'r-', label='处理后数据')
+        else:
+            # 每个值保持到下一段起点，最后一段画到数据末尾
+            self.ax2.stairs(processed_data, run_edges, color='r', baseline=None, label='处理后数据')
         self.ax2.set_title('处理后数据')
         self.ax2.grid(True)
         self.ax2.legend()
@@ -74,4 +96,33 @@ class PlotCanvas(QWidget):
         
         # 调整布局并刷新
         self.figure.tight_layout()
-        self.canvas.draw()
\ No newline at end of file
+        self.canvas.draw()
+
+
+def available_backends() -> List[str]:
+    """Return the names of the plot backends that can be used."""
+    backends = ['matplotlib']
+    # 只查找模块而不导入，避免拖慢启动
+    if importlib.util.find_spec('pyqtgraph') is not None:
+        backends.append('pyqtgraph')
+    return backends
+
+
+def create_plot_canvas(backend: str = 'matplotlib') -> QWidget:
+    """
+    Create a plot canvas for the given backend.
+    
+    Every canvas provides ``update_plot(original, processed, title, run_edges)``.
+    
+    Args:
+        backend: 'matplotlib' for export quality, 'pyqtgraph' for large data
+        
+    Returns:
+        Plot canvas widget
+    """
+    if backend == 'matplotlib':
+        return PlotCanvas()
+    if backend == 'pyqtgraph':
+        from .pyqtgraph_canvas import PyQtGraphCanvas
+        return PyQtGraphCanvas()
+    raise ValueError(f"未知的绘图后端：{backend}")
@@ -0,0 +1,66 @@
+from typing import Optional
+import numpy as np
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+import pyqtgraph as pg
+
+
+class PyQtGraphCanvas(QWidget):
+    """Widget for displaying large plots with pyqtgraph."""
+    
+    def __init__(self):
+        super().__init__()
+        self._setup_ui()
+    
+    def _setup_ui(self) -> None:
+        """Setup the user interface."""
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        
+        # 创建图表
+        self.graphics = pg.GraphicsLayoutWidget()
+        self.graphics.setBackground('w')
+        layout.addWidget(self.graphics)
+        
+        # 创建子图
+        self.plot1 = self.graphics.addPlot(row=0, col=0)
+        self.plot2 = self.graphics.addPlot(row=1, col=0)
+        
+        for plot in (self.plot1, self.plot2):
+            plot.showGrid(x=True, y=True)
+            # 只绘制可见区域，并按峰值降采样以保留尖峰
+            plot.setClipToView(True)
+            plot.setDownsampling(auto=True, mode='peak')
+            plot.addLegend()
+            plot.setLabel('bottom', '数据点')
+            plot.setLabel('left', '值')
+        
+        # 曲线只创建一次，刷新时仅替换数据
+        self.curve1 = self.plot1.plot(pen='b', name='原始数据', connect='finite')
+        self.curve2 = self.plot2.plot(pen='r', name='处理后数据', connect='finite')
+        self.plot2.setTitle('处理后数据')
+    
+    def update_plot(self, 
+                   original_data: np.ndarray, 
+                   processed_data: np.ndarray,
+                   title: str,
+                   run_edges: Optional[np.ndarray] = None) -> None:
+        """
+        Update the plot with new data.
+        
+        Args:
+            original_data: Original data array
+            processed_data: Processed data array
+            title: Plot title
+            run_edges: Run boundaries, one more than processed values; draws steps
+        """
+        self.plot1.setTitle(f'原始数据 - {title}')
+        self.curve1.setData(original_data)
+        if run_edges is None:
+            self.curve2.setData(processed_data, stepMode=None)
+        else:
+            # 每个值保持到下一段起点，最后一段画到数据末尾
+            self.curve2.setData(run_edges, processed_data, stepMode='center')
+        
+        # 数据变化后重新适配坐标范围
+        self.plot1.enableAutoRange()
+        self.plot2.enableAutoRange()
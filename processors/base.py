@@ -1,20 +1,30 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any
-import polars as pl
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
 
 class DataProcessor(ABC):
     """Base class for all data processors."""
     
+    # 处理器面板标题
+    name: str = ""
+    
     @abstractmethod
-    def process(self, data: pl.Series) -> pl.Series:
+    def process_frame(self, frame: pl.LazyFrame, column: str) -> pl.LazyFrame:
         """
-        Process the input data series.
+        Apply the processing to one column of a lazy frame.
+        
+        Rows removed by the processor are removed from the whole frame, so
+        the remaining columns (including DateTime) stay aligned.
         
         Args:
-            data: Input data series to process
+            frame: Input lazy frame
+            column: Name of the column to process
             
         Returns:
-            Processed data series
+            Processed lazy frame
         """
         pass
     
@@ -1,30 +1,35 @@
-from typing import Optional
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, 
-    QCheckBox, QLabel
+    QCheckBox, QLabel, QSpinBox, QPushButton, QMessageBox
 )
 from PyQt6.QtCore import Qt
-import polars as pl
+from utils.config import TIME_COLUMN
 from .base import DataProcessor
 
+if TYPE_CHECKING:
+    import polars as pl
+
 class DuplicateFilter(DataProcessor):
     """Filter consecutive duplicate values."""
     
+    name = "连续重复值过滤"
+    
     def __init__(self):
         self.widget = None
         self.use_filter = False
+        self.stuck_threshold = 60
     
-    def process(self, data: pl.Series) -> pl.Series:
-        """Apply duplicate filtering to the data."""
+    def process_frame(self, frame: pl.LazyFrame, column: str) -> pl.LazyFrame:
+        """Apply duplicate filtering to one column of a lazy frame."""
         if not self.use_filter:
-            return data
-            
-        # 创建一个布尔掩码，标记与前一个值不同的位置
-        mask = data != data.shift()
-        # 第一个值应该保留
-        mask = mask.fill_null(True)
-        
-        return data.filter(mask)
+            return frame
+        
+        from utils.rle import mark_runs
+        
+        # 每段只保留第一个值，并记录每段的起止位置，绘图时按阶梯线还原保持时长
+        return mark_runs(frame, column)
     
     def get_widget(self) -> QWidget:
         """Create and return the configuration widget."""
@@ -40,8 +45,22 @@ class DuplicateFilter(DataProcessor):
         self.use_filter_cb = QCheckBox("启用连续重复值过滤")
         self.use_filter_cb.stateChanged.connect(self._on_state_changed)
         
+        controls = QHBoxLayout()
+        
+        self.threshold_spin = QSpinBox()
+        self.threshold_spin.setRange(1, 10000000)
+        self.threshold_spin.setValue(self.stuck_threshold)
+        
+        self.detect_button = QPushButton("检测卡死区间")
+        self.detect_button.clicked.connect(self._on_detect)
+        
         # 添加到布局
+        controls.addWidget(QLabel("卡死阈值(点):"))
+        controls.addWidget(self.threshold_spin)
+        controls.addWidget(self.detect_button)
+        
         layout.addWidget(self.use_filter_cb)
+        layout.addLayout(controls)
         widget.setLayout(layout)
         
         return widget
@@ -51,6 +70,29 @@ class DuplicateFilter(DataProcessor):
         self.use_filter = state == Qt.CheckState.Checked.value
         self._update_main_window()  # 更新图表
         
+    def _on_detect(self) -> None:
+        """Report intervals where the current column held one value."""
+        main_window = self.widget.window()
+        if main_window is None or main_window.df is None:
+            return
+        
+        column = main_window.column_selector.currentText()
+        if not column:
+            return
+        
+        from utils.rle import stuck_intervals
+        
+        self.stuck_threshold = self.threshold_spin.value()
+        df = main_window.df
+        intervals = stuck_intervals(df[column], self.stuck_threshold, df[TIME_COLUMN])
+        
+        lines = [f"共 {len(intervals)} 个卡死区间（超过 {self.stuck_threshold} 点）"]
+        for row in intervals.head(10).iter_rows(named=True):
+            lines.append(
+                f"{row['start_time']} ~ {row['end_time']}：{row[column]}，{row['length']} 点"
+            )
+        QMessageBox.information(self.widget, "卡死区间", "\n".join(lines))
+    
     def _update_main_window(self) -> None:
         """Update the main window plot."""
         # 获取主窗口实例并更新图表
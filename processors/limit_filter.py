@@ -1,29 +1,35 @@
-from typing import Optional
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, 
     QCheckBox, QLabel, QDoubleSpinBox, QPushButton
 )
 from PyQt6.QtCore import Qt
-import polars as pl
 from .base import DataProcessor
 
+if TYPE_CHECKING:
+    import polars as pl
+
 class LimitFilter(DataProcessor):
     """Filter data based on upper and lower limits."""
     
+    name = "上下限过滤"
+    
     def __init__(self):
         self.widget = None
         self.use_filter = False
         self.lower_limit = -999999.0
         self.upper_limit = 999999.0
+        self.data_range: Optional[tuple] = None
     
-    def process(self, data: pl.Series) -> pl.Series:
-        """Apply limit filtering to the data."""
+    def process_frame(self, frame: pl.LazyFrame, column: str) -> pl.LazyFrame:
+        """Apply limit filtering to one column of a lazy frame."""
         if not self.use_filter:
-            return data
-            
-        return data.filter(
-            (data >= self.lower_limit) & 
-            (data <= self.upper_limit)
+            return frame
+        
+        import polars as pl
+        return frame.filter(
+            pl.col(column).is_between(self.lower_limit, self.upper_limit)
         )
     
     def get_widget(self) -> QWidget:
@@ -48,6 +54,11 @@ class LimitFilter(DataProcessor):
         self.upper_spin = QDoubleSpinBox()
         self.upper_spin.setRange(-999999, 999999)
         
+        # 面板按需创建，补上创建前记录的数据范围
+        if self.data_range is not None:
+            self.lower_spin.setValue(self.data_range[0])
+            self.upper_spin.setValue(self.data_range[1])
+        
         self.apply_button = QPushButton("应用上下限")
         self.apply_button.setEnabled(False)
         self.apply_button.clicked.connect(self._on_apply)  # 添加点击事件连接
@@ -87,7 +98,11 @@ class LimitFilter(DataProcessor):
     
     def update_limits(self, data: pl.Series) -> None:
         """Update limit values based on data."""
+        self.data_range = (float(data.min()), float(data.max()))
+        if self.widget is None:
+            self.use_filter = False
+            return
         self.use_limits_cb.setChecked(False)
-        self.lower_spin.setValue(float(data.min()))
-        self.upper_spin.setValue(float(data.max()))
+        self.lower_spin.setValue(self.data_range[0])
+        self.upper_spin.setValue(self.data_range[1])
         
\ No newline at end of file
@@ -1,29 +1,37 @@
-from typing import Optional
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, 
     QCheckBox, QLabel, QSpinBox
 )
 from PyQt6.QtCore import Qt
-import polars as pl
 from .base import DataProcessor
 
+if TYPE_CHECKING:
+    import polars as pl
+
 class MovingAverage(DataProcessor):
     """Apply moving average to data."""
     
+    name = "移动平均"
+    
     def __init__(self):
         self.widget = None
         self.use_ma = False
         self.window_size = 5
     
-    def process(self, data: pl.Series) -> pl.Series:
-        """Apply moving average to the data."""
+    def process_frame(self, frame: pl.LazyFrame, column: str) -> pl.LazyFrame:
+        """Apply moving average to one column of a lazy frame."""
         if not self.use_ma:
-            return data
-            
-        return data.rolling_mean(
-            window_size=self.window_size,
-            center=True
-        ).fill_null(strategy='forward').fill_null(strategy='backward')
+            return frame
+        
+        import polars as pl
+        return frame.with_columns(
+            pl.col(column).rolling_mean(
+                window_size=self.window_size,
+                center=True
+            ).fill_null(strategy='forward').fill_null(strategy='backward')
+        )
     
     def get_widget(self) -> QWidget:
         """Create and return the configuration widget."""
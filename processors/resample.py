@@ -0,0 +1,141 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, 
+    QCheckBox, QLabel, QComboBox
+)
+from PyQt6.QtCore import Qt
+from utils.config import TIME_COLUMN
+from .base import DataProcessor
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# 可选的时间桶大小（显示名称 -> polars 时间间隔）
+INTERVALS = {
+    "1分钟": "1m",
+    "5分钟": "5m",
+    "15分钟": "15m",
+    "1小时": "1h",
+    "1天": "1d",
+}
+
+# 可选的聚合方式
+METHODS = {
+    "均值": "mean",
+    "最小值": "min",
+    "最大值": "max",
+    "最后值": "last",
+    "计数": "count",
+}
+
+class Resample(DataProcessor):
+    """Aggregate data into time buckets over the DateTime column."""
+    
+    name = "时间重采样"
+    
+    def __init__(self, time_column: str = TIME_COLUMN):
+        self.widget = None
+        self.use_resample = False
+        self.time_column = time_column
+        self.every = "1m"
+        self.method = "mean"
+        self.fill_empty = False
+    
+    def process_frame(self, frame: pl.LazyFrame, column: str) -> pl.LazyFrame:
+        """Aggregate every column of a lazy frame by time bucket."""
+        if not self.use_resample:
+            return frame
+        
+        import polars as pl
+        import polars.selectors as cs
+        time = pl.col(self.time_column)
+        values = pl.exclude(self.time_column)
+        
+        if self.method in ("last", "count"):
+            aggs = [getattr(values, self.method)()]
+        else:
+            # 均值等只对数值列有意义，其他列取最后值
+            others = cs.all() - cs.numeric() - cs.by_name(self.time_column)
+            aggs = [getattr(cs.numeric(), self.method)(), others.last()]
+        
+        # 空时间无法分桶；已排序的数据（如加载后的数据）排序时直接跳过
+        frame = frame.filter(time.is_not_null()).sort(self.time_column)
+        names = frame.collect_schema().names()
+        frame = frame.group_by_dynamic(
+            self.time_column, every=self.every
+        ).agg(aggs).select(names)  # 保持原有列顺序
+        
+        if self.fill_empty:
+            # 补齐没有数据的时间桶
+            grid = frame.select(
+                pl.datetime_range(
+                    time.min(), time.max(), interval=self.every
+                ).alias(self.time_column)
+            )
+            frame = grid.join(frame, on=self.time_column, how="left")
+            if self.method == "count":
+                frame = frame.with_columns(values.fill_null(0))
+            else:
+                frame = frame.with_columns(values.forward_fill())
+        return frame
+    
+    def get_widget(self) -> QWidget:
+        """Create and return the configuration widget."""
+        if self.widget is None:
+            self.widget = self._create_widget()
+        return self.widget
+    
+    def _create_widget(self) -> QWidget:
+        widget = QWidget()
+        layout = QVBoxLayout()
+        
+        # 创建控件
+        self.use_resample_cb = QCheckBox("启用时间重采样")
+        self.use_resample_cb.stateChanged.connect(self._on_state_changed)
+        
+        controls = QHBoxLayout()
+        
+        self.interval_combo = QComboBox()
+        self.interval_combo.addItems(INTERVALS.keys())
+        self.interval_combo.currentTextChanged.connect(self._on_settings_changed)
+        
+        self.method_combo = QComboBox()
+        self.method_combo.addItems(METHODS.keys())
+        self.method_combo.currentTextChanged.connect(self._on_settings_changed)
+        
+        self.fill_empty_cb = QCheckBox("前向填充空桶")
+        self.fill_empty_cb.stateChanged.connect(self._on_settings_changed)
+        
+        # 添加到布局
+        controls.addWidget(QLabel("间隔:"))
+        controls.addWidget(self.interval_combo)
+        controls.addWidget(QLabel("聚合:"))
+        controls.addWidget(self.method_combo)
+        controls.addWidget(self.fill_empty_cb)
+        
+        layout.addWidget(self.use_resample_cb)
+        layout.addLayout(controls)
+        widget.setLayout(layout)
+        
+        return widget
+    
+    def _on_state_changed(self, state: int) -> None:
+        """Handle checkbox state change."""
+        self.use_resample = state == Qt.CheckState.Checked.value
+        self._update_main_window()
+    
+    def _on_settings_changed(self, *args) -> None:
+        """Handle interval, method or fill option change."""
+        self.every = INTERVALS[self.interval_combo.currentText()]
+        self.method = METHODS[self.method_combo.currentText()]
+        self.fill_empty = self.fill_empty_cb.isChecked()
+        if self.use_resample:
+            self._update_main_window()
+    
+    def _update_main_window(self) -> None:
+        """Update the main window plot."""
+        # 获取主窗口实例并更新图表
+        main_window = self.widget.window()
+        if main_window:
+            main_window._update_plot()
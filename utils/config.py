@@ -3,6 +3,9 @@ from typing import Dict, Any
 import json
 import os
 
+# 时间列名称
+TIME_COLUMN = "DateTime"
+
 class Config:
     """Configuration manager."""
     
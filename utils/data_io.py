@@ -0,0 +1,265 @@
+"""Data loading utilities."""
+from __future__ import annotations
+from typing import List, Sequence, Union, TYPE_CHECKING
+from pathlib import Path
+import glob
+import polars as pl
+from .config import TIME_COLUMN
+from .rle import RUN_START, RUN_END
+
+if TYPE_CHECKING:
+    from processors.base import DataProcessor
+
+# 支持导出的文件格式
+EXPORT_FORMATS = (".parquet", ".csv")
+
+PathSource = Union[str, Path, Sequence[Union[str, Path]]]
+
+
+def resolve_paths(source: PathSource, pattern: str = "*.csv") -> List[Path]:
+    """
+    Resolve a file, directory, glob pattern or list of paths to CSV files.
+
+    Args:
+        source: File path, directory, glob pattern or a sequence of these
+        pattern: File pattern used when a directory is given
+
+    Returns:
+        Sorted list of file paths
+    """
+    if isinstance(source, (str, Path)):
+        sources = [source]
+    else:
+        sources = list(source)
+
+    paths: List[Path] = []
+    for item in sources:
+        path = Path(item)
+        if path.is_dir():
+            paths.extend(sorted(path.glob(pattern)))
+        elif path.is_file():
+            paths.append(path)
+        else:
+            paths.extend(Path(p) for p in sorted(glob.glob(str(item))))
+
+    if not paths:
+        raise FileNotFoundError(f"未找到数据文件：{source}")
+    return paths
+
+
+def _common_dtype(dtypes: List[pl.DataType]) -> pl.DataType:
+    """Pick a dtype every given dtype can be cast to."""
+    unique = set(dtypes)
+    if len(unique) == 1:
+        return dtypes[0]
+    if all(dtype.is_numeric() for dtype in unique):
+        return pl.Float64
+    if all(dtype.is_temporal() for dtype in unique):
+        return pl.Datetime("us")
+    return pl.String
+
+
+def _align_schemas(dfs: List[pl.DataFrame],
+                   paths: List[Path],
+                   time_column: str) -> List[pl.DataFrame]:
+    """Give every frame the same columns, order and dtypes."""
+    for path, df in zip(paths, dfs):
+        if time_column not in df.columns:
+            raise ValueError(f"文件 {path} 中缺少时间列 {time_column}")
+
+    # 按首次出现的顺序合并列名，时间列放在最前
+    columns: List[str] = [time_column]
+    for df in dfs:
+        for name in df.columns:
+            if name not in columns:
+                columns.append(name)
+
+    dtypes = {}
+    for name in columns:
+        present = [df.schema[name] for df in dfs if name in df.columns]
+        # 全为空的列（如传感器离线、只有表头的文件）会被推断为字符串，不参与类型选择
+        with_data = [
+            df.schema[name] for df in dfs
+            if name in df.columns and df[name].null_count() < df.height
+        ]
+        dtypes[name] = _common_dtype(with_data or present)
+    # 未能解析为时间的时间列统一转换为 Datetime
+    if not dtypes[time_column].is_temporal():
+        dtypes[time_column] = pl.Datetime("us")
+
+    aligned = []
+    for df in dfs:
+        exprs = []
+        for name in columns:
+            dtype = dtypes[name]
+            if name not in df.columns:
+                exprs.append(pl.lit(None, dtype=dtype).alias(name))
+            elif df.schema[name] == dtype:
+                exprs.append(pl.col(name))
+            elif (name == time_column and df.schema[name] == pl.String
+                  and df[name].null_count() < df.height):
+                exprs.append(pl.col(name).str.to_datetime().cast(dtype))
+            else:
+                exprs.append(pl.col(name).cast(dtype))
+        aligned.append(df.select(exprs))
+    return aligned
+
+
+def _merge_sorted(frames: List[pl.DataFrame], time_column: str) -> pl.DataFrame:
+    """K-way merge of frames that are each sorted by the time column."""
+    lazy = [frame.lazy() for frame in frames]
+    # 两两归并，保持文件顺序以便时间相同时后一个文件排在后面
+    while len(lazy) > 1:
+        merged = [
+            lazy[i].merge_sorted(lazy[i + 1], key=time_column)
+            for i in range(0, len(lazy) - 1, 2)
+        ]
+        if len(lazy) % 2:
+            merged.append(lazy[-1])
+        lazy = merged
+    return lazy[0].collect()
+
+
+def _merge_duplicates(df: pl.DataFrame, time_column: str) -> pl.DataFrame:
+    """Collapse rows sharing a timestamp, later non-null values win per column."""
+    # 已排序数据中重复的时间戳相邻
+    time = df[time_column]
+    duplicated = ((time == time.shift(1)) | (time == time.shift(-1))).fill_null(False)
+    if not duplicated.any():
+        return df
+
+    # 只对重复的时间戳分组，逐列取最后一个非空值
+    merged = df.filter(duplicated).group_by(time_column, maintain_order=True).agg(
+        pl.all().drop_nulls().last()
+    )
+    return df.filter(~duplicated).merge_sorted(merged.select(df.columns), key=time_column)
+
+
+def load_csv_files(source: PathSource, time_column: str = TIME_COLUMN) -> pl.DataFrame:
+    """
+    Load one or more CSV files into a single DateTime-sorted frame.
+
+    Files are parsed in parallel and their schemas reconciled: missing
+    columns are filled with nulls and conflicting dtypes are widened,
+    ignoring columns that are entirely empty in a file. Rows without a
+    timestamp are dropped.
+    Files that are already sorted are merged without a full sort. When a
+    timestamp occurs more than once, the rows are merged column by column
+    and the last non-null value (from the later file) wins.
+
+    Args:
+        source: File path, directory, glob pattern or a sequence of these
+        time_column: Name of the timestamp column
+
+    Returns:
+        Merged DataFrame sorted by the time column
+    """
+    paths = resolve_paths(source)
+
+    # 并行解析所有文件，之后再统一列类型，以便识别全为空的列
+    dfs = pl.collect_all([pl.scan_csv(path, try_parse_dates=True) for path in paths])
+    dfs = _align_schemas(dfs, paths, time_column)
+
+    # 丢弃时间为空的行，否则排序后集中在开头，重采样也无法处理
+    dfs = [df.drop_nulls(time_column) for df in dfs]
+
+    # 仅对内部无序的文件排序
+    dfs = [
+        df.with_columns(pl.col(time_column).set_sorted())
+        if df[time_column].is_sorted()
+        else df.sort(time_column, maintain_order=True)
+        for df in dfs
+    ]
+    df = _merge_sorted(dfs, time_column)
+
+    df = _merge_duplicates(df, time_column)
+
+    # 合并为单块内存，之后转换为NumPy时可以零拷贝；
+    # 归并后的排序标记会丢失，重新标记以便后续按时间排序时直接跳过
+    return df.rechunk().with_columns(pl.col(time_column).set_sorted())
+
+
+def build_processing_plan(data: Union[pl.DataFrame, pl.LazyFrame],
+                          processors: Sequence[DataProcessor],
+                          column: str,
+                          all_columns: bool = False,
+                          time_column: str = TIME_COLUMN,
+                          keep_runs: bool = False) -> pl.LazyFrame:
+    """
+    Build the lazy pipeline that produces the processed data.
+
+    Args:
+        data: Loaded data
+        processors: Processors applied in order to the column
+        column: Name of the processed column
+        all_columns: Keep every column instead of only the processed one
+        time_column: Name of the timestamp column
+        keep_runs: Keep the run positions added by DuplicateFilter
+
+    Returns:
+        Lazy frame with the timestamps aligned to the processed rows
+    """
+    frame = data.lazy()
+    if not all_columns:
+        frame = frame.select(time_column, column)
+
+    for processor in processors:
+        frame = processor.process_frame(frame, column)
+
+    if not keep_runs:
+        frame = frame.drop(RUN_START, RUN_END, strict=False)
+    return frame
+
+
+def sink_frame(frame: pl.LazyFrame, path: Union[str, Path]) -> None:
+    """
+    Write a lazy frame to Parquet or CSV in streaming mode.
+
+    Older polars versions cannot stream every operation (for example
+    rolling_mean, shift or group_by_dynamic). In that case the frame is
+    collected in memory and written instead.
+
+    Args:
+        frame: Lazy frame to write
+        path: Output path, the format is chosen by its suffix
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in EXPORT_FORMATS:
+        raise ValueError(f"不支持的导出格式：{suffix}，仅支持 {', '.join(EXPORT_FORMATS)}")
+
+    try:
+        if suffix == ".parquet":
+            frame.sink_parquet(path)
+        else:
+            frame.sink_csv(path)
+    except pl.exceptions.InvalidOperationError:
+        # 流式引擎不支持该查询，退回到内存中收集后写入
+        df = frame.collect()
+        if suffix == ".parquet":
+            df.write_parquet(path)
+        else:
+            df.write_csv(path)
+
+
+def export_processed(data: Union[pl.DataFrame, pl.LazyFrame],
+                     processors: Sequence[DataProcessor],
+                     column: str,
+                     path: Union[str, Path],
+                     all_columns: bool = False,
+                     time_column: str = TIME_COLUMN) -> None:
+    """
+    Export processed data together with its timestamps.
+
+    Only a LazyFrame source keeps the whole export out of memory; a
+    DataFrame (as used by the GUI) is already loaded.
+
+    Args:
+        data: Loaded data, pass a LazyFrame to stream from the source files
+        processors: Processors applied in order to the column
+        column: Name of the processed column
+        path: Output path ending in .parquet or .csv
+        all_columns: Keep every column instead of only the processed one
+        time_column: Name of the timestamp column
+    """
+    frame = build_processing_plan(data, processors, column, all_columns, time_column)
+    sink_frame(frame, path)
@@ -0,0 +1,78 @@
+"""Run-length encoding utilities."""
+from typing import Optional
+import polars as pl
+
+# 重复值过滤添加的辅助列：每段在过滤前的起点和终点（不含），
+# 双下划线前缀避免与用户数据列重名
+RUN_START = "__run_start"
+RUN_END = "__run_end"
+
+
+def mark_runs(frame: pl.LazyFrame, column: str) -> pl.LazyFrame:
+    """
+    Keep the first row of every run of equal consecutive values.
+
+    Adds RUN_START and RUN_END (exclusive) with each run's position in the
+    input frame. Consecutive nulls form a single run.
+
+    Args:
+        frame: Input lazy frame
+        column: Name of the column that defines the runs
+
+    Returns:
+        Lazy frame with one row per run
+    """
+    values = pl.col(column)
+    return frame.with_columns(
+        pl.int_range(pl.len(), dtype=pl.UInt32).alias(RUN_START),
+        pl.len().alias(RUN_END)
+    ).filter(
+        # 位掩码标记每段的第一个值，空值之间视为相同
+        values.ne_missing(values.shift()) | (pl.col(RUN_START) == 0)
+    ).with_columns(
+        # 最后一段延续到数据末尾
+        pl.col(RUN_START).shift(-1).fill_null(pl.col(RUN_END)).alias(RUN_END)
+    )
+
+
+def encode_runs(data: pl.Series) -> pl.DataFrame:
+    """
+    Encode a series into runs of equal consecutive values.
+
+    Args:
+        data: Input data series
+
+    Returns:
+        DataFrame with columns value, start and length, one row per run
+    """
+    return mark_runs(data.to_frame().lazy(), data.name).select(
+        pl.col(data.name),
+        pl.col(RUN_START).alias("start"),
+        (pl.col(RUN_END) - pl.col(RUN_START)).alias("length"),
+    ).collect()
+
+
+def stuck_intervals(data: pl.Series,
+                    min_length: int,
+                    time: Optional[pl.Series] = None) -> pl.DataFrame:
+    """
+    Find intervals where a sensor held the same value.
+
+    Args:
+        data: Input data series
+        min_length: A run counts as stuck when it is longer than this many points
+        time: Timestamps aligned with data, adds start/end times if given
+
+    Returns:
+        DataFrame of runs longer than min_length points, longest first
+    """
+    # 空值段是数据缺失而不是卡死
+    runs = encode_runs(data).filter(
+        pl.col(data.name).is_not_null() & (pl.col("length") > min_length)
+    )
+    if time is not None:
+        runs = runs.with_columns(
+            time.gather(runs["start"]).alias("start_time"),
+            time.gather(runs["start"] + runs["length"] - 1).alias("end_time"),
+        )
+    return runs.sort("length", descending=True, maintain_order=True)